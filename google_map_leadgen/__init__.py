@@ -4,14 +4,34 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __license__ = "MIT"
 
-from .config import CSV_FILENAME, DEBUG, HEADLESS, MAX_TABS, SAVE_AS_CSV, TARGET_LEADS
-from .scraper import collect_lead_links, extract_lead_data, process_all_leads, scrape
+from .config import (
+    CSV_FILENAME,
+    DEBUG,
+    HEADLESS,
+    MAX_TABS,
+    SAVE_AS_CSV,
+    TARGET_LEADS,
+    Config,
+    get_config,
+)
+from .scraper import (
+    LeadCache,
+    collect_lead_links,
+    extract_lead_data,
+    process_all_leads,
+    scrape,
+    to_records,
+)
 
 __all__ = [
     "scrape",
+    "LeadCache",
     "collect_lead_links",
     "extract_lead_data",
     "process_all_leads",
+    "to_records",
+    "Config",
+    "get_config",
     "TARGET_LEADS",
     "MAX_TABS",
     "HEADLESS",
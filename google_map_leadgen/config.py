@@ -5,14 +5,19 @@ Environment Variables:
     LEADS: Number of leads to collect (default: 25)
     MAX_TAB_ALLOWED: Maximum concurrent tabs (default: 2)
     HEADLESS: Run browser in headless mode (default: true)
+    MAX_RPS: Maximum detail-page navigations per second (default: 3)
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 
-# Scraper Settings
+# Scraper Settings (import-time snapshot; prefer get_config() where values
+# should track the current environment)
 TARGET_LEADS = int(os.getenv("LEADS", "25"))
 MAX_TABS = int(os.getenv("MAX_TAB_ALLOWED", "2"))
 HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
+MAX_RPS = float(os.getenv("MAX_RPS", "3"))
 
 # Output Settings
 SAVE_AS_CSV = True
@@ -20,3 +25,37 @@ CSV_FILENAME = "scraped_data.csv"
 
 # Development Settings
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+
+@dataclass(frozen=True)
+class Config:
+    """Runtime configuration, read from the environment via from_env()."""
+
+    target_leads: int = 25
+    max_tabs: int = 2
+    headless: bool = True
+    max_rps: float = 3.0
+    save_as_csv: bool = SAVE_AS_CSV
+    csv_filename: str = CSV_FILENAME
+    debug: bool = False
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        return cls(
+            target_leads=int(os.getenv("LEADS", "25")),
+            max_tabs=int(os.getenv("MAX_TAB_ALLOWED", "2")),
+            headless=os.getenv("HEADLESS", "true").lower() == "true",
+            max_rps=float(os.getenv("MAX_RPS", "3")),
+            debug=os.getenv("DEBUG", "false").lower() == "true",
+        )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Current configuration, parsed from the environment once and cached.
+
+    Call get_config.cache_clear() after changing environment variables
+    (tests do this instead of reloading the module).
+    """
+    return Config.from_env()
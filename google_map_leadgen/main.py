@@ -7,8 +7,8 @@ import json
 import logging
 import sys
 
-from .config import CSV_FILENAME, MAX_TABS, TARGET_LEADS
-from .scraper import scrape
+from .config import CSV_FILENAME, get_config
+from .scraper import LEAD_FIELDS, scrape, to_records
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,19 +17,86 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def save_to_csv(results: list[dict], filename: str = CSV_FILENAME):
-    """Save results to CSV file."""
-    if not results:
+CSV_FIELDS = LEAD_FIELDS
+
+
+def save_to_csv(results: list[dict] | dict[str, list], filename: str = CSV_FILENAME):
+    """
+    Save results to CSV file.
+
+    Accepts either a list of per-lead dicts or the column-oriented
+    dict-of-lists produced by the scraper's internal accumulation; the
+    columnar form is written in a single zip pass with no per-row dicts.
+    """
+    # An empty columnar result ({"name": [], ...}) is truthy; check the
+    # columns themselves so both forms skip writing a header-only file.
+    if not results or (isinstance(results, dict) and not any(results.values())):
         return
-    field_names = results[0].keys()
     with open(filename, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=field_names)
-        writer.writeheader()
-        writer.writerows(results)
+        if isinstance(results, dict):
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            writer.writerows(zip(*(results[field] for field in CSV_FIELDS)))
+        else:
+            dict_writer = csv.DictWriter(f, fieldnames=results[0].keys())
+            dict_writer.writeheader()
+            dict_writer.writerows(results)
     logger.info(f"Data saved to {filename}")
 
 
+async def scrape_to_csv(
+    query: str,
+    filename: str,
+    target: int | None = None,
+    max_tabs: int | None = None,
+) -> int:
+    """
+    Scrape leads and stream each one to the CSV as it is extracted.
+
+    Rows are written and flushed as workers produce them, so peak memory
+    stays bounded by the number of tabs instead of the number of leads.
+
+    Returns:
+        Number of rows written.
+    """
+    written = 0
+    write_lock = asyncio.Lock()
+
+    with open(filename, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(
+            f, fieldnames=CSV_FIELDS, extrasaction="ignore", restval="N/A"
+        )
+        writer.writeheader()
+
+        def _write_row_sync(data: dict):
+            writer.writerow(data)
+            f.flush()
+
+        async def _write_lead(data: dict):
+            nonlocal written
+            async with write_lock:
+                # Disk writes run in a worker thread so a slow flush never
+                # stalls the event loop (and with it every other tab).
+                await asyncio.to_thread(_write_row_sync, data)
+                written += 1
+
+        results = await scrape(
+            query, target=target, max_tabs=max_tabs, on_lead=_write_lead
+        )
+        # A scrape that ignores on_lead (older callers, test doubles) still
+        # returns its results; persist those too.
+        if isinstance(results, dict):
+            results = to_records(results)
+        for data in results:
+            await _write_lead(data)
+
+    if written:
+        logger.info(f"Data saved to {filename}")
+    return written
+
+
 async def main():
+    config = get_config()
     parser = argparse.ArgumentParser(
         description="Google Maps Lead Generator - Extract business leads"
     )
@@ -53,14 +120,14 @@ async def main():
     parser.add_argument(
         "--leads",
         type=int,
-        default=TARGET_LEADS,
-        help=f"Number of leads to collect (default: {TARGET_LEADS})",
+        default=config.target_leads,
+        help=f"Number of leads to collect (default: {config.target_leads})",
     )
     parser.add_argument(
         "--tabs",
         type=int,
-        default=MAX_TABS,
-        help=f"Number of concurrent browser tabs (default: {MAX_TABS})",
+        default=config.max_tabs,
+        help=f"Number of concurrent browser tabs (default: {config.max_tabs})",
     )
 
     args = parser.parse_args()
@@ -70,18 +137,25 @@ async def main():
         sys.exit(0)
 
     logger.info(f"Starting lead generation for: {args.query}")
-    results = await scrape(args.query, target=args.leads, max_tabs=args.tabs)
 
-    if results:
-        logger.info(f"Total leads extracted: {len(results)}")
-
-        if args.json:
-            print(json.dumps(results, indent=2, ensure_ascii=False))
-        else:
-            save_to_csv(results, args.output)
+    if args.json:
+        results = await scrape(args.query, target=args.leads, max_tabs=args.tabs)
+        # The scraper returns column-oriented results; JSON output stays
+        # row-per-lead for consumers.
+        records = to_records(results)
+        if not records:
+            logger.warning("No results found")
+            sys.exit(1)
+        logger.info(f"Total leads extracted: {len(records)}")
+        print(json.dumps(records, indent=2, ensure_ascii=False))
     else:
-        logger.warning("No results found")
-        sys.exit(1)
+        written = await scrape_to_csv(
+            args.query, args.output, target=args.leads, max_tabs=args.tabs
+        )
+        if not written:
+            logger.warning("No results found")
+            sys.exit(1)
+        logger.info(f"Total leads extracted: {written}")
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ Architecture:
     5. scrape()             - Main orchestrator
 
 Performance Optimizations:
+    - Collection and extraction run concurrently via a bounded URL queue
     - Phase 1: No route interception for faster initial load
     - Phase 2: Blocks images/media/fonts to reduce bandwidth
     - Single page.evaluate() replaces multiple round-trips
@@ -21,24 +22,147 @@ Performance Optimizations:
 """
 
 import asyncio
+import json
 import logging
-from contextlib import suppress
+import random
+import sqlite3
+import time
+import weakref
+from contextlib import AsyncExitStack, nullcontext, suppress
+from math import ceil
+from pathlib import Path
+from urllib.parse import quote_plus
 
 from camoufox.async_api import AsyncCamoufox
 
-from .config import HEADLESS, MAX_TABS, TARGET_LEADS
+from .config import get_config
 
 logger = logging.getLogger(__name__)
 
-_BLOCKED_RESOURCE_TYPES = frozenset(("image", "media", "font", "ping", "websocket"))
-_WAIT_SLICE_SECONDS = 2
+# Fixed column order for lead records, shared by accumulation and CSV output.
+LEAD_FIELDS = ("name", "address", "phone", "website")
+
+
+def new_lead_columns() -> dict[str, list]:
+    """Return an empty column-oriented (dict-of-lists) result store."""
+    return {field: [] for field in LEAD_FIELDS}
+
+
+def to_records(columns: dict[str, list]) -> list[dict]:
+    """Convert column-oriented results back to a list of per-lead dicts."""
+    return [
+        dict(zip(LEAD_FIELDS, row))
+        for row in zip(*(columns[field] for field in LEAD_FIELDS))
+    ]
+
+
+_BLOCKED_RESOURCE_TYPES = frozenset(
+    (
+        "image",
+        "imageset",
+        "media",
+        "font",
+        "stylesheet",
+        "texttrack",
+        "object",
+        "beacon",
+        "csp_report",
+        "ping",
+        "websocket",
+    )
+)
+# Tracker/analytics endpoints that survive resource-type filtering.
+# XHR/fetch stay unblocked: place pages load their data dynamically.
+_BLOCKED_URL_SUBSTRINGS = (
+    "google-analytics",
+    "googletagmanager",
+    "doubleclick",
+    "gstatic.com/recaptcha",
+    "play.google.com/log",
+)
+_SEARCH_URL = "https://www.google.com/maps/search/{}?entry=ttu"
 _NAVIGATION_TIMEOUT_MS = 45_000
 _DETAIL_SELECTOR_TIMEOUT_MS = 30_000
+_SPA_RENDER_TIMEOUT_MS = 8_000
+_FAST_FETCH_TIMEOUT_MS = 5_000
+_EXTRACT_ATTEMPTS = 2
+_MAX_PAGE_USES = 50
+# How many queued URLs a warm page fetches in one batched evaluate call.
+_FAST_BATCH_SIZE = 5
+# Past this many tabs a single browser's protocol transport serializes
+# traffic; extra tabs go to additional browser instances instead.
+_TABS_PER_BROWSER = 8
+# Cached leads are good for a day; business details rarely churn faster.
+_CACHE_TTL_SECONDS = 86_400
+_CACHE_PATH = Path.home() / ".cache" / "google_map_leadgen" / "leads.db"
+
+# Pages that completed a full navigation once; their warm SPA state can be
+# reused with an in-place URL swap instead of another full page load.
+_WARM_PAGES: weakref.WeakSet = weakref.WeakSet()
+
+# Pages whose navigation timed out; a hung load can leave the renderer with
+# in-flight requests and half-built documents, so the pool swaps these for
+# fresh pages instead of reusing them.
+_RECYCLE_PAGES: weakref.WeakSet = weakref.WeakSet()
+
+
+# Patterns handed to CDP Network.setBlockedURLs so blocking happens inside
+# the browser process, with no per-request protocol round-trip.
+_BLOCKED_URL_PATTERNS = (
+    "*.jpg",
+    "*.jpeg",
+    "*.png",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.css",
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*doubleclick*",
+    "*gstatic.com/recaptcha*",
+    "*play.google.com/log*",
+)
+
+
+async def _setup_resource_blocking(page, block_other: bool = False):
+    """
+    Block heavy resources on a page, in-browser when possible.
+
+    Chromium-based engines accept Network.setBlockedURLs over CDP, which
+    filters requests in the browser process instead of round-tripping every
+    request through Python. Engines without CDP (e.g. Camoufox's Firefox)
+    fall back to per-request route interception.
+
+    Args:
+        page: Page to install blocking on
+        block_other: Also abort "other" resource types on the route fallback.
+            Off by default since it can break dynamic XHR-adjacent traffic
+            (CDP's URL globs have no type concept, so it only affects the
+            fallback path)
+    """
+    try:
+        cdp = await page.context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
+    except Exception:
+        blocked = _BLOCKED_RESOURCE_TYPES
+        if block_other:
+            blocked = blocked | {"other"}
+        await page.route("**/*", lambda route: _block_heavy_resources(route, blocked))
 
 
-async def _block_heavy_resources(route):
-    """Abort heavy resources (images, media, fonts) to improve performance."""
-    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+async def _block_heavy_resources(route, blocked=_BLOCKED_RESOURCE_TYPES):
+    """Abort heavy resources (images, media, fonts) and tracker requests."""
+    if route.request.resource_type in blocked or any(
+        substring in route.request.url for substring in _BLOCKED_URL_SUBSTRINGS
+    ):
         await route.abort()
     else:
         await route.continue_()
@@ -61,46 +185,247 @@ _EXTRACT_DATA_JS = """
 }
 """
 
+# Scrolls the results feed and resolves as soon as new place anchors are
+# observed (or after a max wait), instead of sleeping a fixed interval.
+_SCROLL_AND_WAIT_JS = """
+async () => {
+    const feed = document.querySelector('div[role="feed"]');
+    if (!feed) return false;
+    const count = () =>
+        feed.querySelectorAll('a[href*="/maps/place/"]').length;
+    const before = count();
+    feed.scrollTop = feed.scrollHeight;
+    return new Promise(resolve => {
+        const observer = new MutationObserver(() => {
+            if (count() > before) {
+                observer.disconnect();
+                resolve(true);
+            }
+        });
+        observer.observe(feed, {childList: true, subtree: true});
+        setTimeout(() => { observer.disconnect(); resolve(false); }, 1500);
+    });
+}
+"""
+
 _COLLECT_LINKS_JS = """
 () => {
     const anchors = document.querySelectorAll('a[href*="/maps/place/"]');
-    return [...anchors].map(a => a.href).filter(Boolean);
+    return [...anchors].map(a => a.href.split('?')[0]).filter(Boolean);
 }
 """
 
 
-async def _wait_in_slices(task: asyncio.Task, total_timeout_ms: int) -> bool:
+def _normalize_place_url(href: str) -> str:
     """
-    Wait for a task in short slices to avoid one large static timeout.
+    Canonicalize a place URL so cache-buster variants dedupe together.
 
-    Returns:
-        True if task finished before timeout, False if timed out.
+    The feed re-emits the same place with varying ?entry= query strings and
+    /data=!4m... segments; stripping both leaves a stable identifier.
     """
-    loop = asyncio.get_running_loop()
-    deadline = loop.time() + (total_timeout_ms / 1000)
+    href = href.split("?", 1)[0]
+    return href.split("/data=", 1)[0]
 
-    while True:
-        remaining = deadline - loop.time()
-        if remaining <= 0:
-            task.cancel()
-            with suppress(asyncio.CancelledError, Exception):
-                await task
-            return False
 
-        try:
-            await asyncio.wait_for(
-                asyncio.shield(task),
-                timeout=min(_WAIT_SLICE_SECONDS, remaining),
-            )
-            return True
-        except TimeoutError:
-            continue
+# Polled in-browser by page.wait_for_function: becomes truthy (returning the
+# extracted record) once the place header has rendered, so readiness check and
+# extraction share a single protocol round-trip.
+_EXTRACT_READY_JS = """
+() => {
+    const extract = window.__extractLead;
+    const data = extract ? extract() : null;
+    if (!data || !data.name || data.name === window.__lastName) return null;
+    window.__lastName = data.name;
+    return data;
+}
+"""
+
+# Fetches a place page's static HTML from inside a warm tab (reusing its
+# cookies and connections) and parses the lead out of the embedded metadata -
+# no JS boot, tiles or rendering. Returns null unless name, address and phone
+# all resolved, so partial parses fall back to a full render.
+_FETCH_LEAD_JS = """
+async (url) => {
+    try {
+        const resp = await fetch(url, {credentials: 'include'});
+        if (!resp.ok) return null;
+        const html = await resp.text();
+        const doc = new DOMParser().parseFromString(html, 'text/html');
+        const title = doc.querySelector('meta[property="og:title"]');
+        if (!title || !title.content) return null;
+        const name = title.content.replace(/ - Google Maps$/, '').trim();
+        const desc = doc.querySelector('meta[property="og:description"]');
+        const address = desc && desc.content ? desc.content.trim() : null;
+        const phone = (html.match(/tel:(\\+?\\d[\\d\\s().-]{5,17}\\d)/) || [])[1];
+        // First quoted URL that is not a Google property or asset CDN
+        // (gstatic, googleapis, googleusercontent, ...): the head is full
+        // of quoted static-resource URLs that would otherwise win. When
+        // nothing trustworthy matches, website stays N/A.
+        const site = (html.match(
+            /"(https?:\\/\\/(?!(?:[\\w.-]+\\.)?(?:google|gstatic|googleapis|googleusercontent|ggpht|googletagmanager|google-analytics|doubleclick|googleadservices|schema|w3)\\.)[^"\\\\]+)"/
+        ) || [])[1];
+        if (!name || !address || !phone) return null;
+        return {name, address, phone, website: site || 'N/A'};
+    } catch (err) {
+        return null;
+    }
+}
+"""
+
+# One Promise.all round-trip fetches and parses a whole batch of place pages;
+# each entry resolves to the same shape as _FETCH_LEAD_JS, or null on failure.
+_EXTRACT_BATCH_JS = "async (urls) => Promise.all(urls.map(" + _FETCH_LEAD_JS + "))"
+
+# Drops already-rendered media nodes after extraction so queued image/video
+# responses are discarded instead of decoded.
+_DROP_MEDIA_JS = """
+() => document.querySelectorAll('img, picture, video').forEach(n => n.remove())
+"""
+
+# Swaps the URL without a full navigation; the Maps SPA re-renders in place,
+# keeping its parsed JS/CSS state warm.
+_SPA_NAVIGATE_JS = """
+(url) => {
+    history.pushState({}, '', url);
+    window.dispatchEvent(new PopStateEvent('popstate'));
+}
+"""
+
+# Registered once per page so the browser parses each snippet a single time;
+# subsequent page.evaluate calls invoke the bindings by name instead of
+# shipping (and re-parsing) the full source on every call.
+_INIT_SCRIPT = (
+    "window.__extractLead = " + _EXTRACT_DATA_JS + ";\n"
+    "window.__collectLinks = " + _COLLECT_LINKS_JS + ";\n"
+    "window.__scrollFeed = " + _SCROLL_AND_WAIT_JS + ";"
+)
+
+
+class RateLimiter:
+    """
+    Async token bucket limiting outbound navigations per second.
+
+    A shared instance is acquired before each detail-page load so many tabs
+    cannot burst requests at Google and trigger throttling or CAPTCHA
+    interstitials - one avoided 30s interstitial timeout pays for a lot of
+    pacing.
+    """
+
+    def __init__(self, rate_per_sec: float | None = None, burst: int | None = None):
+        if rate_per_sec is None:
+            rate_per_sec = get_config().max_rps
+        self._rate = max(rate_per_sec, 0.001)
+        self._capacity = burst if burst is not None else max(1, int(self._rate))
+        self._tokens = float(self._capacity)
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._updated is not None:
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+            self._updated = now
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._tokens = 1
+                self._updated = loop.time()
+            self._tokens -= 1
+
+
+class LeadCache:
+    """
+    On-disk lead cache keyed by place URL.
+
+    Place URLs are stable identifiers, so a lead extracted once can be
+    served from disk on later runs instead of paying a full navigation.
+    Backed by stdlib sqlite3; all disk work runs in a worker thread so
+    the event loop never blocks, and entries expire after a TTL so stale
+    business data ages out.
+    """
+
+    def __init__(self, path=None, ttl: float = _CACHE_TTL_SECONDS):
+        self._path = str(path) if path is not None else str(_CACHE_PATH)
+        self._ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        # One connection shared across worker threads; serialize access.
+        self._lock = asyncio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._path, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS leads ("
+            "url TEXT PRIMARY KEY, data TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        conn.commit()
+        return conn
+
+    def _get_sync(self, url: str) -> dict | None:
+        row = self._conn.execute(
+            "SELECT data, created FROM leads WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        data, created = row
+        if time.time() - created > self._ttl:
+            self._conn.execute("DELETE FROM leads WHERE url = ?", (url,))
+            self._conn.commit()
+            return None
+        return json.loads(data)
+
+    def _put_sync(self, url: str, data: dict):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO leads (url, data, created) VALUES (?, ?, ?)",
+            (url, json.dumps(data), time.time()),
+        )
+        self._conn.commit()
+
+    async def get(self, url: str) -> dict | None:
+        """Return the cached lead for url, or None if absent or expired."""
+        async with self._lock:
+            if self._conn is None:
+                self._conn = await asyncio.to_thread(self._connect)
+            return await asyncio.to_thread(self._get_sync, url)
+
+    async def put(self, url: str, data: dict):
+        """Store a lead under url, replacing any earlier entry."""
+        async with self._lock:
+            if self._conn is None:
+                self._conn = await asyncio.to_thread(self._connect)
+            await asyncio.to_thread(self._put_sync, url, data)
+
+
+async def _new_worker_context(browser):
+    """Create the shared context worker pages are derived from.
+
+    A single context lets the browser reuse connections and cache across
+    tabs instead of paying fresh TLS/DNS per page. The JS helpers are
+    registered here once, so every derived page inherits them compiled
+    instead of re-shipping the source per page.
+    """
+    context = await browser.new_context(viewport={"width": 800, "height": 600})
+    await context.add_init_script(_INIT_SCRIPT)
+    return context
+
+
+async def _new_worker_page(context, block_other: bool = False):
+    """Create a page with resource blocking from the shared worker context."""
+    page = await context.new_page()
+    await _setup_resource_blocking(page, block_other=block_other)
+    return page
 
 
 async def collect_lead_links(
     browser,
     query: str,
-    target: int = TARGET_LEADS,
+    target: int | None = None,
     url_queue: asyncio.Queue[str | None] | None = None,
 ) -> list[str]:
     """
@@ -109,16 +434,17 @@ async def collect_lead_links(
     Args:
         browser: Camoufox browser instance
         query: Search query (e.g., "Mobile Repair Shop in New York")
-        target: Maximum number of lead URLs to collect
+        target: Maximum number of lead URLs to collect (config default)
         url_queue: Optional queue to stream newly found URLs to consumers
 
     Returns:
         List of unique Google Maps place URLs
     """
+    if target is None:
+        target = get_config().target_leads
     page = await browser.new_page(viewport={"width": 800, "height": 600})
-    search_url = (
-        f"https://www.google.com/maps/search/{query.replace(' ', '+')}?entry=ttu"
-    )
+    await page.add_init_script(_INIT_SCRIPT)
+    search_url = _SEARCH_URL.format(quote_plus(query))
 
     await page.goto(search_url, wait_until="domcontentloaded", timeout=60_000)
 
@@ -129,28 +455,34 @@ async def collect_lead_links(
         await page.close()
         return []
 
-    update_btn = page.get_by_role("checkbox", name="Update results when map moves")
-    if asyncio.iscoroutine(update_btn):
-        update_btn = await update_btn
-
-    is_clicked = await update_btn.click()
-    if is_clicked:
-        with suppress(Exception):
+    # Best effort: the toggle is optional, so a missing or slow checkbox must
+    # not stall collection. (click() returns None, so the old "re-click if
+    # clicked" branch never had an effect and is gone.)
+    with suppress(Exception):
+        async with asyncio.timeout(2):
+            update_btn = page.get_by_role(
+                "checkbox", name="Update results when map moves"
+            )
+            if asyncio.iscoroutine(update_btn):
+                update_btn = await update_btn
             await update_btn.click()
 
-    lead_links: set[str] = set()
+    seen: set[str] = set()
+    lead_links: list[str] = []
     stale_rounds = 0
     max_stale = 5
 
     while len(lead_links) < target and stale_rounds < max_stale:
-        hrefs = await page.evaluate(_COLLECT_LINKS_JS)
+        hrefs = await page.evaluate("() => window.__collectLinks()")
         new_links = 0
 
         for href in hrefs:
-            if href in lead_links:
+            href = _normalize_place_url(href)
+            if href in seen:
                 continue
 
-            lead_links.add(href)
+            seen.add(href)
+            lead_links.append(href)
             new_links += 1
 
             if url_queue is not None:
@@ -167,83 +499,418 @@ async def collect_lead_links(
         if len(lead_links) >= target:
             break
 
-        scroll_js = (
-            "() => { const feed = document.querySelector('div[role=\"feed\"]'); "
-            "if (feed) feed.scrollTop = feed.scrollHeight; }"
-        )
-        await page.evaluate(scroll_js)
-        await asyncio.sleep(0.8)
+        new_content = await page.evaluate("() => window.__scrollFeed()")
+        if not new_content:
+            # The observer timed out without fresh anchors; give the feed a
+            # short grace period before the next (possibly stale) round.
+            await asyncio.sleep(0.3)
 
     await page.close()
-    return list(lead_links)[:target]
+    return lead_links[:target]
+
+
+async def extract_lead_fast(
+    page, url: str, limiter: RateLimiter | None = None
+) -> dict | None:
+    """
+    Try to extract a lead from the place page's static HTML, skipping the
+    full render.
+
+    A single in-page fetch replaces navigation + framework boot + tile
+    requests. Only works from a tab already on the Maps origin (same-origin
+    fetch with session cookies), and only trusts complete parses - anything
+    else returns None so the caller falls back to extract_lead_data.
+    """
+    if page not in _WARM_PAGES:
+        return None
+
+    try:
+        if limiter is not None:
+            await limiter.acquire()
+        async with asyncio.timeout(_FAST_FETCH_TIMEOUT_MS / 1000):
+            data = await page.evaluate(_FETCH_LEAD_JS, url)
+        if not isinstance(data, dict):
+            return None
+        return await asyncio.to_thread(_normalize_lead, data)
+    except Exception as exc:
+        logger.debug(f"Fast fetch failed for {url}: {exc}")
+        return None
 
 
-async def extract_lead_data(page, url: str) -> dict | None:
+def _normalize_lead(data: dict) -> dict:
+    """Collapse whitespace runs in string fields of a raw lead."""
+    return {
+        key: " ".join(value.split()) if isinstance(value, str) else value
+        for key, value in data.items()
+    }
+
+
+def _normalize_leads(entries: list) -> list[dict | None]:
+    """Apply _normalize_lead across a batch, mapping bad entries to None."""
+    return [
+        _normalize_lead(entry) if isinstance(entry, dict) else None for entry in entries
+    ]
+
+
+async def extract_lead_data_batch(
+    page, urls: list[str], limiter: RateLimiter | None = None
+) -> list[dict | None]:
+    """
+    Fetch and parse several place pages in a single evaluate round-trip.
+
+    Runs the fast-path fetch for the whole batch inside one Promise.all,
+    so a batch of k URLs costs one protocol round-trip instead of k.
+    Same constraints as extract_lead_fast: warm pages only, and every
+    entry is None unless its parse was complete.
+    """
+    if not urls:
+        return []
+    if page not in _WARM_PAGES:
+        return [None] * len(urls)
+
+    try:
+        if limiter is not None:
+            # One token per outbound fetch, batched or not.
+            for _ in urls:
+                await limiter.acquire()
+        async with asyncio.timeout(_FAST_FETCH_TIMEOUT_MS / 1000 * len(urls)):
+            data = await page.evaluate(_EXTRACT_BATCH_JS, urls)
+        if not isinstance(data, list) or len(data) != len(urls):
+            return [None] * len(urls)
+        return await asyncio.to_thread(_normalize_leads, data)
+    except Exception as exc:
+        logger.debug(f"Batch fetch of {len(urls)} urls failed: {exc}")
+        return [None] * len(urls)
+
+
+async def _extract_via_spa_navigation(page, url: str) -> dict | None:
+    """
+    Swap the URL in-place on a warm tab and wait for the app to re-render.
+
+    The _EXTRACT_READY_JS poll compares against window.__lastName, which
+    survives pushState (but not a full navigation), so it only resolves once
+    the new place has actually rendered.
+    """
+    try:
+        await page.evaluate(_SPA_NAVIGATE_JS, url)
+        handle = await page.wait_for_function(
+            _EXTRACT_READY_JS, timeout=_SPA_RENDER_TIMEOUT_MS
+        )
+        return await handle.json_value()
+    except Exception as exc:
+        logger.debug(f"SPA navigation failed for {url}: {exc}")
+        return None
+
+
+async def extract_lead_data(
+    page,
+    url: str,
+    nav_sem: asyncio.Semaphore | None = None,
+    limiter: RateLimiter | None = None,
+    cache: LeadCache | None = None,
+) -> dict | None:
     """
     Navigate to a place URL and extract business data.
 
+    Pages that already rendered a place reuse their warm SPA state via an
+    in-place URL swap; cold pages (and failed swaps) pay a full navigation.
+
     Args:
         page: Camoufox page instance
         url: Google Maps place URL
+        nav_sem: Optional semaphore bounding concurrent full navigations,
+            so one stalled tab cannot drag the rest into the same rate wall
+        limiter: Optional shared RateLimiter; a token is taken immediately
+            before each outbound load so bursts never exceed the bucket
+        cache: Optional LeadCache; hits skip navigation entirely and
+            successful extractions are written back for later runs
 
     Returns:
         Dictionary with name, address, phone, website or None if failed
     """
+    if cache is not None:
+        cached = await cache.get(url)
+        if cached:
+            return cached
+
+    if page in _WARM_PAGES:
+        if limiter is not None:
+            await limiter.acquire()
+        data = await _extract_via_spa_navigation(page, url)
+        if data:
+            data = await asyncio.to_thread(_normalize_lead, data)
+            if cache is not None:
+                await cache.put(url, data)
+            return data
+
     try:
-        navigation_task = asyncio.create_task(
-            page.goto(url, wait_until="domcontentloaded", timeout=0)
-        )
-        if not await _wait_in_slices(
-            navigation_task, total_timeout_ms=_NAVIGATION_TIMEOUT_MS
-        ):
+        try:
+            # Only the navigation itself is semaphored; extraction runs free.
+            async with nav_sem if nav_sem is not None else nullcontext():
+                if limiter is not None:
+                    await limiter.acquire()
+                async with asyncio.timeout(_NAVIGATION_TIMEOUT_MS / 1000):
+                    await page.goto(url, wait_until="commit", timeout=0)
+        except TimeoutError:
+            # asyncio.timeout cancelled the goto at its await point, but the
+            # renderer may still hold half-loaded state; flag the page so the
+            # pool rebuilds it rather than reusing it.
+            _RECYCLE_PAGES.add(page)
+            _WARM_PAGES.discard(page)
             logger.debug(f"Timed out while loading {url}")
             return None
 
-        selector_task = asyncio.create_task(
-            page.wait_for_selector("h1.DUwDvf", timeout=0)
+        # Polls at rAF cadence inside the browser and returns the extracted
+        # record directly - no separate wait_for_selector/evaluate hops.
+        handle = await page.wait_for_function(
+            _EXTRACT_READY_JS, timeout=_DETAIL_SELECTOR_TIMEOUT_MS
         )
-        if not await _wait_in_slices(
-            selector_task, total_timeout_ms=_DETAIL_SELECTOR_TIMEOUT_MS
-        ):
-            logger.debug(f"Timed out waiting for data on {url}")
-            return None
-
-        data = await page.evaluate(_EXTRACT_DATA_JS)
-        return data if data else None
+        data = await handle.json_value()
+        if data:
+            _WARM_PAGES.add(page)
+            with suppress(Exception):
+                await page.evaluate(_DROP_MEDIA_JS)
+            # Python-side cleanup runs off the event loop so a slow
+            # normalization never stalls the other tabs.
+            data = await asyncio.to_thread(_normalize_lead, data)
+            if cache is not None:
+                await cache.put(url, data)
+            return data
+        return None
     except Exception as exc:
         logger.debug(f"Failed to extract data from {url}: {exc}")
         return None
 
 
-async def _page_worker(
+class PagePool:
+    """
+    Fixed pool of reusable worker pages.
+
+    Opening a page costs tens to hundreds of milliseconds and very
+    long-lived pages slowly leak renderer memory; the pool amortizes page
+    creation across the whole run and recycles a page (close + recreate)
+    after _MAX_PAGE_USES uses. When several contexts are given (one per
+    browser instance), pages are distributed round-robin so no single
+    browser transport carries all the traffic.
+    """
+
+    def __init__(self, context, size: int, block_other: bool = False):
+        self._contexts = context if isinstance(context, list) else [context]
+        self._size = size
+        self._block_other = block_other
+        self._pages: asyncio.Queue = asyncio.Queue()
+        self._uses: dict[int, int] = {}
+        self._next_context = 0
+
+    async def start(self):
+        """Pre-create the fixed set of pages."""
+        for _ in range(self._size):
+            await self._pages.put(await self._create())
+
+    async def _create(self):
+        context = self._contexts[self._next_context % len(self._contexts)]
+        self._next_context += 1
+        page = await _new_worker_page(context, block_other=self._block_other)
+        self._uses[id(page)] = 0
+        return page
+
+    async def acquire(self):
+        """Borrow a page; blocks while all pages are in use."""
+        return await self._pages.get()
+
+    async def release(self, page):
+        """Return a page, recycling it when flagged or its budget is spent."""
+        self._uses[id(page)] = self._uses.get(id(page), 0) + 1
+        if page in _RECYCLE_PAGES or self._uses[id(page)] >= _MAX_PAGE_USES:
+            _RECYCLE_PAGES.discard(page)
+            self._uses.pop(id(page), None)
+            with suppress(Exception):
+                await page.close()
+            page = await self._create()
+        await self._pages.put(page)
+
+
+async def _extract_with_retries(
     page,
+    url: str,
+    limiter: RateLimiter | None = None,
+    nav_sem: asyncio.Semaphore | None = None,
+    cache: LeadCache | None = None,
+) -> dict | None:
+    """Run the fast path then full extraction, retrying with jittered backoff."""
+    for attempt in range(_EXTRACT_ATTEMPTS):
+        # The limiter is acquired inside the extractors, right before each
+        # outbound load, so every request to Maps spends exactly one token.
+        data = await extract_lead_fast(page, url, limiter=limiter)
+        if data is not None:
+            # extract_lead_data writes back internally; fast-path hits
+            # need the same treatment or re-runs refetch most URLs.
+            if cache is not None:
+                await cache.put(url, data)
+        else:
+            data = await extract_lead_data(
+                page, url, nav_sem=nav_sem, limiter=limiter, cache=cache
+            )
+        if data:
+            return data
+        if attempt + 1 < _EXTRACT_ATTEMPTS:
+            # Transient failures (timeout, one-off interstitial) often
+            # recover on retry; jitter avoids synchronized re-hits.
+            await asyncio.sleep(0.5 * 2**attempt + random.random() * 0.3)
+    return None
+
+
+async def _page_worker(
+    pool: PagePool,
     url_queue: asyncio.Queue[str | None],
-    results: list,
+    results: dict[str, list],
+    on_lead=None,
+    limiter: RateLimiter | None = None,
+    nav_sem: asyncio.Semaphore | None = None,
+    work_sem: asyncio.BoundedSemaphore | None = None,
+    cache: LeadCache | None = None,
 ):
     """
-    Worker that owns a persistent page and processes URLs from queue.
+    Worker that borrows pooled pages to process URLs from the queue.
 
     Args:
-        page: Camoufox page instance
+        pool: PagePool supplying reusable worker pages
         url_queue: Queue of URLs to process
-        results: List to append successful results
+        results: Column-oriented store (see new_lead_columns) for successes
+        on_lead: Optional async callback; when given, each lead is handed to
+            it (e.g. a streaming CSV writer) instead of accumulated in memory
+        limiter: Shared RateLimiter pacing navigations across all workers
+        nav_sem: Shared semaphore bounding concurrent full navigations
+        work_sem: Shared BoundedSemaphore giving a hard cap on concurrent
+            per-URL processing regardless of worker count
+        cache: Optional LeadCache consulted before any page work; hits
+            skip extraction (and the page pool) entirely
     """
     while True:
         url = await url_queue.get()
-        try:
-            if url is None:
-                return
+        if url is None:
+            url_queue.task_done()
+            return
 
-            data = await extract_lead_data(page, url)
-            if data:
-                results.append(data)
+        batch = [url]
+        extracted: dict[str, dict | None] = {}
+        try:
+            if cache is not None:
+                extracted[url] = await cache.get(url)
+
+            if extracted.get(url) is None:
+                async with work_sem if work_sem is not None else nullcontext():
+                    page = await pool.acquire()
+                    try:
+                        if page in _WARM_PAGES:
+                            # A warm page can fetch several places in one
+                            # Promise.all round-trip; pull more queued work
+                            # so the batch rides this evaluate call.
+                            while len(batch) < _FAST_BATCH_SIZE:
+                                try:
+                                    extra = url_queue.get_nowait()
+                                except asyncio.QueueEmpty:
+                                    break
+                                if extra is None:
+                                    # Another worker's shutdown sentinel.
+                                    url_queue.put_nowait(None)
+                                    url_queue.task_done()
+                                    break
+                                batch.append(extra)
+                            if len(batch) > 1:
+                                fetched = await extract_lead_data_batch(
+                                    page, batch, limiter=limiter
+                                )
+                                extracted.update(zip(batch, fetched))
+                                if cache is not None:
+                                    for u, data in zip(batch, fetched):
+                                        if data:
+                                            await cache.put(u, data)
+
+                        # Per-URL path for whatever the batch missed.
+                        for u in batch:
+                            if extracted.get(u):
+                                continue
+                            extracted[u] = await _extract_with_retries(
+                                page, u, limiter, nav_sem, cache
+                            )
+                    finally:
+                        await pool.release(page)
+
+            for u in batch:
+                data = extracted.get(u)
+                if data:
+                    if on_lead is not None:
+                        await on_lead(data)
+                    else:
+                        # Column-wise append: 4 shared lists instead of one
+                        # dict allocation (+ per-key hashing) per lead.
+                        for field in LEAD_FIELDS:
+                            results[field].append(data.get(field))
+                else:
+                    logger.info(f"Dropping {u} after {_EXTRACT_ATTEMPTS} attempts")
         finally:
-            url_queue.task_done()
+            for _ in batch:
+                url_queue.task_done()
+
+
+async def _run_page_workers(
+    contexts,
+    url_queue: asyncio.Queue[str | None],
+    results: dict[str, list],
+    num_tabs: int,
+    on_lead=None,
+    block_other: bool = False,
+    cache: LeadCache | None = None,
+    collector=None,
+):
+    """
+    Launch num_tabs page workers over a shared pool and run them to done.
+
+    Builds the machinery both orchestrators need - a PagePool over the
+    given context(s), a shared RateLimiter, and the navigation and work
+    semaphores - then runs the workers in one TaskGroup. When collector
+    is given (an awaitable streaming URLs into url_queue), it runs
+    alongside the workers and the shutdown sentinels are enqueued once it
+    finishes; otherwise the caller must have queued URLs and sentinels up
+    front. Returns the collector's result, or None without one.
+    """
+    pool = PagePool(contexts, num_tabs, block_other=block_other)
+    await pool.start()
+    limiter = RateLimiter()
+    nav_sem = asyncio.Semaphore(num_tabs)
+    work_sem = asyncio.BoundedSemaphore(num_tabs)
+
+    collected = None
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(num_tabs):
+            tg.create_task(
+                _page_worker(
+                    pool,
+                    url_queue,
+                    results,
+                    on_lead,
+                    limiter,
+                    nav_sem,
+                    work_sem,
+                    cache,
+                )
+            )
+
+        if collector is not None:
+            collected = await collector
+            for _ in range(num_tabs):
+                await url_queue.put(None)
+    return collected
 
 
 async def process_all_leads(
-    browser, urls: list[str], max_tabs: int = MAX_TABS
-) -> list[dict]:
+    browser,
+    urls: list[str],
+    max_tabs: int | None = None,
+    on_lead=None,
+    cache: LeadCache | None = None,
+) -> dict[str, list]:
     """
     Process multiple URLs concurrently using a pool of persistent pages.
 
@@ -251,13 +918,20 @@ async def process_all_leads(
         browser: Camoufox browser instance
         urls: List of place URLs to scrape
         max_tabs: Maximum number of concurrent tabs
+        on_lead: Optional async callback receiving each lead as it is
+            extracted; when given, the returned columns stay empty
+        cache: Optional LeadCache; already-seen URLs are served from disk
+            and fresh extractions are written back
 
     Returns:
-        List of dictionaries containing business data
+        Column-oriented results, one list per LEAD_FIELDS entry; use
+        to_records() for the row-per-lead view
     """
     if not urls:
-        return []
+        return new_lead_columns()
 
+    if max_tabs is None:
+        max_tabs = get_config().max_tabs
     num_tabs = max(1, min(max_tabs, len(urls)))
 
     url_queue: asyncio.Queue[str | None] = asyncio.Queue()
@@ -266,33 +940,28 @@ async def process_all_leads(
     for _ in range(num_tabs):
         url_queue.put_nowait(None)
 
-    results: list[dict] = []
-
-    pages = []
-    for _ in range(num_tabs):
-        p = await browser.new_page(viewport={"width": 800, "height": 600})
-        await p.route("**/*", _block_heavy_resources)
-        pages.append(p)
-
-    tasks = [
-        asyncio.create_task(_page_worker(page, url_queue, results)) for page in pages
-    ]
+    results = new_lead_columns()
 
-    await url_queue.join()
-    await asyncio.gather(*tasks)
-
-    for p in pages:
-        try:
-            await p.close()
-        except Exception:
-            pass
+    context = await _new_worker_context(browser)
+    try:
+        await _run_page_workers(
+            context, url_queue, results, num_tabs, on_lead=on_lead, cache=cache
+        )
+    finally:
+        with suppress(Exception):
+            await context.close()
 
     return results
 
 
 async def scrape(
-    query: str, target: int = TARGET_LEADS, max_tabs: int = MAX_TABS
-) -> list[dict]:
+    query: str,
+    target: int | None = None,
+    max_tabs: int | None = None,
+    on_lead=None,
+    block_other: bool = False,
+    cache: LeadCache | None = None,
+) -> dict[str, list]:
     """
     Main entry point - scrape business leads from Google Maps.
 
@@ -300,50 +969,70 @@ async def scrape(
         query: Search query (e.g., "Restaurants in San Francisco")
         target: Number of leads to collect
         max_tabs: Number of concurrent browser tabs
+        on_lead: Optional async callback receiving each lead as it is
+            extracted, so large runs never hold all results in memory
+        block_other: Also block "other" resource types (see
+            _setup_resource_blocking); off by default
+        cache: Optional LeadCache (e.g. LeadCache()); repeat runs serve
+            already-seen URLs from disk instead of re-navigating
 
     Returns:
-        List of dictionaries containing:
-            - name: Business name
-            - address: Physical address
-            - phone: Phone number
-            - website: Website URL
+        Column-oriented results keyed by LEAD_FIELDS (name, address,
+        phone, website), empty when on_lead is given; callers wanting a
+        row-per-lead view can pass the result through to_records()
     """
+    config = get_config()
+    if target is None:
+        target = config.target_leads
+    if max_tabs is None:
+        max_tabs = config.max_tabs
     if target <= 0:
-        return []
+        return new_lead_columns()
 
-    async with AsyncCamoufox(headless=HEADLESS) as browser:
-        num_tabs = max(1, min(max_tabs, target))
-        url_queue: asyncio.Queue[str | None] = asyncio.Queue()
-        results: list[dict] = []
+    num_tabs = max(1, min(max_tabs, target))
 
-        lead_urls = await collect_lead_links(
-            browser, query, target=target, url_queue=url_queue
-        )
-
-        pages = []
-        for _ in range(num_tabs):
-            page = await browser.new_page(viewport={"width": 800, "height": 600})
-            await page.route("**/*", _block_heavy_resources)
-            pages.append(page)
-
-        tasks = [
-            asyncio.create_task(_page_worker(page, url_queue, results))
-            for page in pages
+    async with AsyncExitStack() as stack:
+        # One browser per _TABS_PER_BROWSER tabs: past that, a single
+        # browser's protocol transport becomes the serialization bottleneck.
+        browsers = [
+            await stack.enter_async_context(AsyncCamoufox(headless=config.headless))
+            for _ in range(ceil(num_tabs / _TABS_PER_BROWSER))
         ]
+        browser = browsers[0]
+        # Bounded so the collector blocks (backpressure) if workers fall
+        # behind; two queued URLs per tab keeps every worker fed without
+        # letting a fast collector buffer the whole result set.
+        url_queue: asyncio.Queue[str | None] = asyncio.Queue(
+            maxsize=max(4, num_tabs * 2)
+        )
+        results = new_lead_columns()
 
-        for _ in range(num_tabs):
-            await url_queue.put(None)
-
-        await url_queue.join()
-        await asyncio.gather(*tasks)
-
-        for page in pages:
-            with suppress(Exception):
-                await page.close()
+        # Open worker tabs and start consuming BEFORE collection begins, so
+        # detail extraction overlaps with the collector's scroll/idle time.
+        contexts = [await _new_worker_context(b) for b in browsers]
+        try:
+            lead_urls = await _run_page_workers(
+                contexts,
+                url_queue,
+                results,
+                num_tabs,
+                on_lead=on_lead,
+                block_other=block_other,
+                cache=cache,
+                collector=collect_lead_links(
+                    browser, query, target=target, url_queue=url_queue
+                ),
+            )
+        finally:
+            for context in contexts:
+                with suppress(Exception):
+                    await context.close()
 
         if not lead_urls:
             logger.info("No leads found for query")
-            return []
+            return results
 
-        logger.info(f"Scraped {len(results)}/{len(lead_urls)} leads successfully")
+        logger.info(
+            f"Scraped {len(results['name'])}/{len(lead_urls)} leads successfully"
+        )
         return results
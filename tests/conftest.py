@@ -0,0 +1,61 @@
+"""Shared fixtures for the unit suite.
+
+AsyncMock construction is relatively expensive, so the common
+browser/page wiring lives here instead of being rebuilt inline in every
+test. Fixtures stay function-scoped: extract_lead_data tracks warm pages
+in a WeakSet keyed by page identity, so reusing one page object across
+tests would leak warm state between them.
+"""
+
+import asyncio
+import sys
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the async suite on uvloop where available.
+
+    uvloop's C scheduler makes Queue/task-heavy tests measurably faster;
+    the stock policy is kept on Windows or when uvloop is not installed.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture
+def mock_page():
+    """A standalone page mock for the extraction helpers."""
+    page = AsyncMock()
+    page.get_by_role = Mock(return_value=AsyncMock())
+    yield page
+    page.reset_mock()
+
+
+@pytest.fixture
+def mock_browser_page(mock_page):
+    """A (browser, page) pair wired the way collect_lead_links opens pages."""
+    browser = AsyncMock()
+    browser.new_page.return_value = mock_page
+    yield browser, mock_page
+    browser.reset_mock()
+
+
+@pytest.fixture
+def mock_browser_context_page(mock_page):
+    """A (browser, context, page) chain matching the worker-context setup."""
+    browser = AsyncMock()
+    context = AsyncMock()
+    browser.new_context.return_value = context
+    context.new_page.return_value = mock_page
+    yield browser, context, mock_page
+    browser.reset_mock()
+    context.reset_mock()
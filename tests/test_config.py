@@ -1,5 +1,7 @@
 """Tests for configuration module."""
 
+import pytest
+
 from google_map_leadgen.config import (
     CSV_FILENAME,
     DEBUG,
@@ -7,6 +9,7 @@ from google_map_leadgen.config import (
     MAX_TABS,
     SAVE_AS_CSV,
     TARGET_LEADS,
+    get_config,
 )
 
 
@@ -31,38 +34,36 @@ class TestConfigDefaults:
 
 
 class TestConfigFromEnv:
-    def test_target_leads_from_env(self, monkeypatch):
-        import importlib
-
-        import google_map_leadgen.config as config_module
+    @pytest.fixture(autouse=True)
+    def _fresh_config(self):
+        get_config.cache_clear()
+        yield
+        get_config.cache_clear()
+
+    def test_defaults(self):
+        config = get_config()
+        assert config.target_leads == 25
+        assert config.max_tabs == 2
+        assert config.headless is True
+        assert config.max_rps == 3.0
+        assert config.debug is False
 
+    def test_target_leads_from_env(self, monkeypatch):
         monkeypatch.setenv("LEADS", "50")
-        importlib.reload(config_module)
-        assert config_module.TARGET_LEADS == 50
+        get_config.cache_clear()
+        assert get_config().target_leads == 50
 
     def test_max_tabs_from_env(self, monkeypatch):
-        import importlib
-
-        import google_map_leadgen.config as config_module
-
         monkeypatch.setenv("MAX_TAB_ALLOWED", "4")
-        importlib.reload(config_module)
-        assert config_module.MAX_TABS == 4
+        get_config.cache_clear()
+        assert get_config().max_tabs == 4
 
     def test_headless_false_from_env(self, monkeypatch):
-        import importlib
-
-        import google_map_leadgen.config as config_module
-
         monkeypatch.setenv("HEADLESS", "false")
-        importlib.reload(config_module)
-        assert config_module.HEADLESS is False
+        get_config.cache_clear()
+        assert get_config().headless is False
 
     def test_debug_true_from_env(self, monkeypatch):
-        import importlib
-
-        import google_map_leadgen.config as config_module
-
         monkeypatch.setenv("DEBUG", "true")
-        importlib.reload(config_module)
-        assert config_module.DEBUG is True
+        get_config.cache_clear()
+        assert get_config().debug is True
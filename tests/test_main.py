@@ -21,6 +21,19 @@ class TestSaveToCSV:
             if os.path.exists(filename):
                 os.unlink(filename)
 
+    def test_save_empty_columnar_results(self):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            filename = f.name
+
+        try:
+            save_to_csv(
+                {"name": [], "address": [], "phone": [], "website": []}, filename
+            )
+            assert not os.path.exists(filename) or os.path.getsize(filename) == 0
+        finally:
+            if os.path.exists(filename):
+                os.unlink(filename)
+
     def test_save_results_creates_file(self):
         results = [
             {
@@ -78,28 +91,28 @@ class TestSaveToCSV:
 
 
 class TestMainCLI:
-    @pytest.mark.asyncio
     async def test_main_exits_without_query(self):
         with pytest.raises(SystemExit):
             await main()
 
-    @pytest.mark.asyncio
-    async def test_main_calls_scrape_with_query(self):
+    async def test_main_calls_scrape_with_query(self, tmp_path):
+        output = str(tmp_path / "out.csv")
         with patch(
             "google_map_leadgen.main.scrape", new_callable=AsyncMock
         ) as mock_scrape:
             mock_scrape.return_value = [{"name": "Test Business"}]
 
-            with patch("sys.argv", ["google_map_leadgen.main", "test query"]):
-                with patch("google_map_leadgen.main.save_to_csv"):
-                    await main()
-                    # It should call with default target and max_tabs from config
-                    mock_scrape.assert_called_once()
-                    args, kwargs = mock_scrape.call_args
-                    assert args[0] == "test query"
-
-    @pytest.mark.asyncio
-    async def test_main_calls_scrape_with_custom_params(self):
+            with patch(
+                "sys.argv", ["google_map_leadgen.main", "test query", "-o", output]
+            ):
+                await main()
+                # It should call with default target and max_tabs from config
+                mock_scrape.assert_called_once()
+                args, kwargs = mock_scrape.call_args
+                assert args[0] == "test query"
+
+    async def test_main_calls_scrape_with_custom_params(self, tmp_path):
+        output = str(tmp_path / "out.csv")
         with patch(
             "google_map_leadgen.main.scrape", new_callable=AsyncMock
         ) as mock_scrape:
@@ -110,21 +123,45 @@ class TestMainCLI:
                 [
                     "google_map_leadgen.main",
                     "test query",
+                    "-o",
+                    output,
                     "--leads",
                     "10",
                     "--tabs",
                     "5",
                 ],
             ):
-                with patch("google_map_leadgen.main.save_to_csv"):
-                    await main()
-                    mock_scrape.assert_called_once_with(
-                        "test query", target=10, max_tabs=5
-                    )
+                await main()
+                args, kwargs = mock_scrape.call_args
+                assert args[0] == "test query"
+                assert kwargs["target"] == 10
+                assert kwargs["max_tabs"] == 5
+
+    async def test_main_streams_leads_to_csv(self, tmp_path):
+        output = str(tmp_path / "out.csv")
+
+        async def fake_scrape(query, target=25, max_tabs=2, on_lead=None):
+            await on_lead({"name": "Streamed Business", "phone": "555-1234"})
+            return []
+
+        with patch("google_map_leadgen.main.scrape", side_effect=fake_scrape):
+            with patch(
+                "sys.argv", ["google_map_leadgen.main", "test query", "-o", output]
+            ):
+                await main()
+
+        with open(output) as f:
+            content = f.read()
+        assert "Streamed Business" in content
+        assert "555-1234" in content
 
-    @pytest.mark.asyncio
     async def test_main_outputs_json(self):
-        results = [{"name": "Test Business", "address": "Test Address"}]
+        results = {
+            "name": ["Test Business"],
+            "address": ["Test Address"],
+            "phone": ["555-1234"],
+            "website": ["https://example.com"],
+        }
 
         with patch(
             "google_map_leadgen.main.scrape", new_callable=AsyncMock